@@ -5,112 +5,392 @@ Plants Database Audit Script
 Проверяет консистентность между YAML файлами
 """
 
+import argparse
+import io
 import yaml
+import os
+import re
 import sys
+import pickle
+import zlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Iterator, List, Optional, Set, Tuple
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Severity of messages yielded by the checks
+ISSUE = '!'
+WARNING = 'W'
+
+# Fields the checks read from the large files. Everything else is skipped
+# while parsing; '*' matches any key, True keeps the whole value
+PLANTS_FIELDS = {'plants': {'*': {
+    'name': True,
+    'soil': {'mix_number': True, 'alternative_mix': True},
+    'watering': {'method': True},
+    'wick_watering': {'recommended': True},
+}}}
+WATER_FIELDS = {'water_requirements': {
+    'individual_requirements': {'*': {
+        'plant_name': True, 'group': True, 'ppm_range': True, 'ph_range': True,
+    }},
+    'water_groups': {'*': {'plants': True}},
+}}
+
+# (attribute, filename, fields) loaded by the auditor; fields=None loads the full file
+YAML_FILES = [
+    ('plants', 'plants.yaml', PLANTS_FIELDS),
+    ('soil_mixes', 'soil-mixes.yaml', None),
+    ('components', 'components.yaml', None),
+    ('fertilizers', 'fertilizers.yaml', None),
+    ('water_reqs', 'water-requirements.yaml', WATER_FIELDS),
+]
+
+# Watering method tokens, e.g. "Ручной/Фитиль*" -> {"ручной", "фитиль"}
+_WORD_RE = re.compile(r'\w+')
+_TOK_WICK = 'фитиль'
+_TOK_MANUAL = 'ручной'
+
+# Files this large are parsed in worker processes. Starting a pool costs
+# about 10-80 ms, while libyaml parses roughly 4-7 MB/s, so only files of
+# about 1 MB take long enough to be worth a process of their own
+POOL_MIN_FILE_SIZE = 1024 * 1024
+
+
+# Parsed YAML is cached here as pickles keyed by file name, mtime and size
+CACHE_DIR = '.audit_cache'
+
+
+def _load_one(path: Path, fields: Optional[dict] = None) -> Tuple[dict, str]:
+    """Load YAML file, returns (data, error). Module-level so Pool can pickle it"""
+    try:
+        st = path.stat()
+        key = f"{path.name}-{st.st_mtime_ns}-{st.st_size}"
+        if fields is not None:
+            key += f"-{zlib.crc32(repr(fields).encode()):08x}"
+        cache = path.parent / CACHE_DIR / f"{key}.pkl"
+        if cache.exists():
+            try:
+                return pickle.loads(cache.read_bytes()), ''
+            except Exception:
+                pass  # Broken cache entry - parse the YAML again
+
+        # Binary mode: libyaml decodes UTF-8 itself
+        with open(path, 'rb') as f:
+            data = None
+            if fields is not None:
+                data = _load_fields(f, fields)
+            if data is None:
+                f.seek(0)
+                data = yaml.load(f, Loader=YamlLoader)
+        _write_cache(cache, path.name, data)
+        return data, ''
+    except Exception as e:
+        return {}, str(e)
+
+
+def _write_cache(cache: Path, name: str, data) -> None:
+    """Store parsed data and drop stale entries for the same file"""
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        for stale in cache.parent.glob(f"{name}-*.pkl"):
+            stale.unlink()
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(data, protocol=5))
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # Cache is optional (e.g. read-only checkout)
+
+
+class _NeedsFullLoad(Exception):
+    """Document uses YAML features the event walker doesn't handle"""
+
+
+def _load_fields(stream, fields: dict):
+    """Build only the parts of a YAML document selected by fields.
+
+    Walks parser events instead of constructing the whole document, so
+    skipped values never become Python objects. Returns None when the
+    document can't be handled this way and needs a full load.
+    """
+    loader = YamlLoader(stream)
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(yaml.StreamEndEvent):
+            return None
+        loader.get_event()  # DocumentStart
+        data = _build_node(loader, fields)
+        loader.get_event()  # DocumentEnd
+        if not loader.check_event(yaml.StreamEndEvent):
+            return None  # Several documents - the full loader reports it
+        return data
+    except (_NeedsFullLoad, yaml.YAMLError):
+        return None
+    finally:
+        loader.dispose()
+
+
+def _build_node(loader, fields):
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent) or getattr(event, 'anchor', None):
+        raise _NeedsFullLoad()
+
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        # Calling the constructor directly keeps the node out of
+        # loader.constructed_objects; unknown tags and merge keys ('<<')
+        # are left to the full loader
+        constructor = loader.yaml_constructors.get(tag)
+        if constructor is None or tag == 'tag:yaml.org,2002:merge':
+            raise _NeedsFullLoad()
+        return constructor(loader, yaml.ScalarNode(tag, event.value, style=event.style))
+
+    # Explicitly tagged collections (!!omap, !!set, ...) build other types
+    if event.tag not in (None, '!'):
+        raise _NeedsFullLoad()
+
+    if isinstance(event, yaml.SequenceStartEvent):
+        items = []
+        while not loader.check_event(yaml.SequenceEndEvent):
+            items.append(_build_node(loader, fields))
+        loader.get_event()
+        return items
+
+    # Mapping
+    mapping = {}
+    while not loader.check_event(yaml.MappingEndEvent):
+        key = _build_node(loader, True)
+        sub = True if fields is True else fields.get(key, fields.get('*'))
+        if sub is None:
+            _skip_node(loader)
+        else:
+            mapping[key] = _build_node(loader, sub)
+    loader.get_event()
+    return mapping
+
+
+def _skip_node(loader):
+    """Consume events of one node without constructing it"""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, yaml.AliasEvent) or getattr(event, 'anchor', None):
+            raise _NeedsFullLoad()
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def _mix_key(value):
+    """Normalize soil mix number: 5 and "5" -> 5, "5-Ф" stays a string"""
+    if isinstance(value, int):
+        return value
+    value = str(value)
+    return int(value) if value.isdecimal() else value
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _load_files(paths: List[Path], fields: List[Optional[dict]]) -> List[Tuple[dict, str]]:
+    """Load files in parallel: large ones in a process pool, the rest on threads"""
+    large = [i for i, p in enumerate(paths) if _file_size(p) >= POOL_MIN_FILE_SIZE]
+    # A single large file gains nothing from its own process, nor does one CPU
+    if len(large) < 2 or (os.cpu_count() or 1) < 2:
+        large = []
+    small = [i for i in range(len(paths)) if i not in large]
+
+    results = [None] * len(paths)
+    pool = multiprocessing.Pool(len(large)) if large else None
+    try:
+        if pool:
+            pending = pool.starmap_async(
+                _load_one, [(paths[i], fields[i]) for i in large], chunksize=1
+            )
+        with ThreadPoolExecutor(max_workers=len(small) or 1) as ex:
+            for i, result in zip(small, ex.map(_load_one, [paths[i] for i in small], [fields[i] for i in small])):
+                results[i] = result
+        if pool:
+            for i, result in zip(large, pending.get()):
+                results[i] = result
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return results
+
 
 class PlantsDatabaseAuditor:
-    def __init__(self, base_path: str = "."):
+    # "min-max" range such as "60-90" or "5.8-6.2"
+    _RANGE_RE = re.compile(r'^\s*([\d.]+)\s*-\s*([\d.]+)\s*$')
+
+    def __init__(self, base_path: str = ".", quiet: bool = False, verbose: Optional[bool] = None):
         self.base_path = Path(base_path)
-        self.issues = []
-        self.warnings = []
-
-        # Load all YAML files
-        self.plants = self._load_yaml('plants.yaml')
-        self.soil_mixes = self._load_yaml('soil-mixes.yaml')
-        self.components = self._load_yaml('components.yaml')
-        self.fertilizers = self._load_yaml('fertilizers.yaml')
-        self.water_reqs = self._load_yaml('water-requirements.yaml')
-
-    def _load_yaml(self, filename: str) -> dict:
-        """Load YAML file"""
-        try:
-            with open(self.base_path / filename, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        except Exception as e:
-            self.issues.append(f"[!] CRITICAL: Cannot load {filename}: {e}")
-            return {}
+        self.quiet = quiet  # Report only critical issues (pass/fail for CI)
+        # Progress lines only on an interactive terminal unless requested
+        self.verbose = sys.stdout.isatty() if verbose is None else verbose
+        # Messages are streamed into text buffers rather than kept as lists
+        self._issues_buf = io.StringIO()
+        self._issue_count = 0
+        self._warnings_buf = io.StringIO()
+        self._warning_count = 0
+
+        # Load all YAML files in parallel
+        paths = [self.base_path / filename for _, filename, _ in YAML_FILES]
+        fields = [f for _, _, f in YAML_FILES]
+        results = _load_files(paths, fields)
+
+        for (attr, filename, _), (data, error) in zip(YAML_FILES, results):
+            if error:
+                self._issue(f"[!] CRITICAL: Cannot load {filename}: {error}")
+            setattr(self, attr, data)
+
+        # Sections used by several checks
+        water_reqs = self.water_reqs.get('water_requirements', {})
+        self.individual_water = water_reqs.get('individual_requirements', {})
+        self.water_groups = water_reqs.get('water_groups', {})
+        self.plants_dict = self.plants.get('plants', {})
+
+        # Reverse indexes by display name (first entry wins on duplicates)
+        self.plant_id_by_name = {}
+        for plant_id, plant_data in self.plants_dict.items():
+            self.plant_id_by_name.setdefault(plant_data.get('name', ''), plant_id)
+        self.water_id_by_plant_name = {}
+        for plant_id, plant_data in self.individual_water.items():
+            self.water_id_by_plant_name.setdefault(plant_data.get('plant_name', ''), plant_id)
+
+    def _issue(self, message: str):
+        """Record critical issue"""
+        self._issue_count += 1
+        # Indent only the first line, as print(f"  {issue}") did
+        self._issues_buf.write(f"  {message}\n")
+
+    def _warn(self, message: str):
+        """Record warning"""
+        self._warning_count += 1
+        self._warnings_buf.write(f"  {message}\n")
+
+    def _progress(self, message: str):
+        """Print progress line in verbose mode"""
+        if self.verbose:
+            print(message)
 
     def audit_all(self):
         """Run all audit checks"""
-        print("[*] Starting Plants Database Audit...\n")
+        self._progress("[*] Starting Plants Database Audit...\n")
 
-        self.check_plant_soil_references()
-        self.check_plant_water_references()
-        self.check_soil_component_references()
-        self.check_water_group_consistency()
-        self.check_wick_watering_consistency()
-        self.check_ppm_ph_ranges()
-        self.check_duplicates_and_conflicts()
+        self._record(self.check_plants())
+        self._record(self.check_soil_component_references())
+        self._record(self.check_water_group_consistency())
+        self._record(self.check_ppm_ph_ranges())
 
         self.print_report()
 
-    def check_plant_soil_references(self):
-        """Check if plants reference valid soil mixes"""
-        print("[*] Checking plant -> soil mix references...")
+    def _record(self, messages: Iterator[Tuple[str, str]]):
+        """Consume (severity, message) pairs yielded by a check"""
+        for severity, message in messages:
+            if severity == ISSUE:
+                self._issue(message)
+            else:
+                self._warn(message)
+
+    def check_plants(self) -> Iterator[Tuple[str, str]]:
+        """Check per-plant references and consistency in a single pass"""
+        self._progress("[*] Checking plants (soil mix, water requirements, wick watering, duplicates)...")
 
-        plants_data = self.plants.get('plants', {})
         soil_mixes_data = self.soil_mixes.get('soil_mixes', {})
 
         # Get all valid mix numbers
-        valid_mixes = set()
-        for mix_id, mix_data in soil_mixes_data.items():
-            mix_num = str(mix_data.get('number', ''))
-            valid_mixes.add(mix_num)
+        valid_mixes = frozenset(
+            _mix_key(mix_data['number'])
+            for mix_data in soil_mixes_data.values()
+            if mix_data.get('number') is not None
+        )
+
+        yield from self._audit_plants_fused(valid_mixes)
+
+        # Water requirements for plants that are not in plants.yaml
+        for plant in self.individual_water:
+            if plant not in self.plants_dict:
+                yield WARNING, (
+                    f"[W] Water requirements exist for unknown plant '{plant}'"
+                )
 
-        # Check each plant
-        for plant_id, plant_data in plants_data.items():
+        self._progress("   [+] Plants checked\n")
+
+    def _audit_plants_fused(self, valid_mixes: Set) -> Iterator[Tuple[str, str]]:
+        """Run all per-plant checks in one loop over plants.yaml"""
+        water_individual = self.individual_water
+
+        for plant_id, plant_data in self.plants_dict.items():
+            # Soil mix references
             soil = plant_data.get('soil', {})
-            mix_number = str(soil.get('mix_number', ''))
+            mix_number = soil.get('mix_number')
 
-            if mix_number and mix_number not in valid_mixes:
-                self.issues.append(
+            if mix_number not in (None, '') and _mix_key(mix_number) not in valid_mixes:
+                yield ISSUE, (
                     f"[!] Plant '{plant_id}' references non-existent mix #{mix_number}"
                 )
 
-            # Check alternative mix if exists
             alt_mix = soil.get('alternative_mix', '')
             if alt_mix:
                 # Extract number from string like "2 (ароидная, фитильный)"
-                alt_num = alt_mix.split()[0] if alt_mix else ''
-                if alt_num and alt_num not in valid_mixes:
-                    self.warnings.append(
+                alt_tokens = str(alt_mix).split()
+                if alt_tokens and _mix_key(alt_tokens[0]) not in valid_mixes:
+                    yield WARNING, (
                         f"[W] Plant '{plant_id}' alternative_mix '{alt_mix}' might be invalid"
                     )
 
-        print("   [+] Plant -> soil mix references checked\n")
-
-    def check_plant_water_references(self):
-        """Check if all plants have water requirements"""
-        print("[*] Checking plant -> water requirements...")
-
-        plants_data = self.plants.get('plants', {})
-        water_individual = self.water_reqs.get('water_requirements', {}).get('individual_requirements', {})
-
-        plants_set = set(plants_data.keys())
-        water_set = set(water_individual.keys())
+            # Water requirements
+            if plant_id not in water_individual:
+                yield ISSUE, (
+                    f"[!] Plant '{plant_id}' missing water requirements"
+                )
 
-        missing_water = plants_set - water_set
-        extra_water = water_set - plants_set
+            # Wick watering: consistency between recommended and method
+            wick = plant_data.get('wick_watering', {})
+            watering_method = plant_data.get('watering', {}).get('method', '')
+            recommended = wick.get('recommended', False)
+            tokens = frozenset(_WORD_RE.findall(watering_method.lower()))
+            has_wick = _TOK_WICK in tokens
+            has_manual = _TOK_MANUAL in tokens
 
-        if missing_water:
-            for plant in missing_water:
-                self.issues.append(
-                    f"[!] Plant '{plant}' missing water requirements"
+            if recommended and not has_wick:
+                yield WARNING, (
+                    f"[W] Plant '{plant_id}': wick_watering recommended=true but method='{watering_method}'"
                 )
-
-        if extra_water:
-            for plant in extra_water:
-                self.warnings.append(
-                    f"[W] Water requirements exist for unknown plant '{plant}'"
+            # Only if it's ONLY wick (not "Ручной/Фитиль")
+            elif recommended is False and has_wick and not has_manual:
+                yield WARNING, (
+                    f"[W] Plant '{plant_id}': wick_watering recommended=false but method includes Фитиль"
                 )
 
-        print("   [+] Plant -> water requirements checked\n")
+            # Duplicate plant names
+            name = plant_data.get('name', '')
+            first_id = self.plant_id_by_name[name]
+            if first_id != plant_id:
+                yield WARNING, (
+                    f"[W] Duplicate plant name '{name}': {first_id} and {plant_id}"
+                )
 
-    def check_soil_component_references(self):
+    def check_soil_component_references(self) -> Iterator[Tuple[str, str]]:
         """Check if soil mixes reference valid components"""
-        print("[*] Checking soil mix -> component references...")
+        self._progress("[*] Checking soil mix -> component references...")
 
         # Get all component names
         components_data = self.components.get('soil_components', {})
@@ -134,143 +414,100 @@ class PlantsDatabaseAuditor:
             'Кокос-перлит'
         ]
 
+        valid_lower = [vc.lower() for vc in valid_components]
+
         for comp in expected_components:
             # Check partial matches (e.g., "Кокос-перлит (50/50)" contains "Кокос-перлит")
-            found = any(comp.lower() in vc.lower() for vc in valid_components)
+            comp_l = comp.lower()
+            found = any(comp_l in vc for vc in valid_lower)
             if not found:
-                self.warnings.append(
+                yield WARNING, (
                     f"[W] Expected component '{comp}' not found in components.yaml"
                 )
 
-        print("   [+] Soil mix -> component references checked\n")
+        self._progress("   [+] Soil mix -> component references checked\n")
 
-    def check_water_group_consistency(self):
+    def check_water_group_consistency(self) -> Iterator[Tuple[str, str]]:
         """Check if water groups are consistent"""
-        print("[*] Checking water group consistency...")
-
-        water_reqs = self.water_reqs.get('water_requirements', {})
-        individual = water_reqs.get('individual_requirements', {})
-        groups = water_reqs.get('water_groups', {})
+        self._progress("[*] Checking water group consistency...")
 
         # Check if all plants in groups exist in individual requirements
-        for group_id, group_data in groups.items():
+        for group_id, group_data in self.water_groups.items():
             group_plants = group_data.get('plants', [])
+            expected_group = group_id.rsplit('_', 1)[-1].upper()  # group_a -> A
 
             for plant_name in group_plants:
-                # Find if this plant exists in individual requirements
-                found = False
-                for plant_id, plant_data in individual.items():
-                    if plant_data.get('plant_name', '') == plant_name:
-                        found = True
-                        # Check if group assignment matches
-                        assigned_group = plant_data.get('group', '')
-                        expected_group = group_id.split('_')[-1].upper()  # group_a -> A
-
-                        if assigned_group != expected_group:
-                            self.issues.append(
-                                f"[!] Plant '{plant_name}' in {group_id} but assigned to group {assigned_group}"
-                            )
-                        break
-
-                if not found:
-                    self.warnings.append(
+                plant_id = self.water_id_by_plant_name.get(plant_name)
+                if plant_id is None:
+                    yield WARNING, (
                         f"[W] Plant '{plant_name}' in {group_id} but not in individual_requirements"
                     )
+                    continue
 
-        print("   [+] Water group consistency checked\n")
-
-    def check_wick_watering_consistency(self):
-        """Check wick watering consistency"""
-        print("[*] Checking wick watering consistency...")
-
-        plants_data = self.plants.get('plants', {})
-
-        for plant_id, plant_data in plants_data.items():
-            wick = plant_data.get('wick_watering', {})
-            watering_method = plant_data.get('watering', {}).get('method', '')
-
-            # Check consistency between recommended and method
-            recommended = wick.get('recommended', False)
-
-            if recommended and 'Фитиль' not in watering_method and 'фитиль' not in watering_method.lower():
-                self.warnings.append(
-                    f"[W] Plant '{plant_id}': wick_watering recommended=true but method='{watering_method}'"
-                )
-
-            if not recommended and recommended is not None:
-                if 'Фитиль' in watering_method or 'фитиль' in watering_method.lower():
-                    # Only if it's ONLY wick (not "Ручной/Фитиль")
-                    if 'Ручной' not in watering_method:
-                        self.warnings.append(
-                            f"[W] Plant '{plant_id}': wick_watering recommended=false but method includes Фитиль"
-                        )
+                # Check if group assignment matches
+                assigned_group = self.individual_water[plant_id].get('group', '')
+                if assigned_group != expected_group:
+                    yield ISSUE, (
+                        f"[!] Plant '{plant_name}' in {group_id} but assigned to group {assigned_group}"
+                    )
 
-        print("   [+] Wick watering consistency checked\n")
+        self._progress("   [+] Water group consistency checked\n")
 
-    def check_ppm_ph_ranges(self):
+    def check_ppm_ph_ranges(self) -> Iterator[Tuple[str, str]]:
         """Check if PPM and pH ranges are logical"""
-        print("[*] Checking PPM and pH ranges...")
-
-        water_individual = self.water_reqs.get('water_requirements', {}).get('individual_requirements', {})
+        self._progress("[*] Checking PPM and pH ranges...")
 
-        for plant_id, plant_data in water_individual.items():
+        for plant_id, plant_data in self.individual_water.items():
             ppm_range = plant_data.get('ppm_range', '')
             ph_range = plant_data.get('ph_range', '')
 
             # Parse PPM range
             if ppm_range and '-' in str(ppm_range):
-                try:
-                    ppm_min, ppm_max = map(int, str(ppm_range).split('-'))
+                parsed = self._parse_range(ppm_range, int)
+                if parsed is None:
+                    yield WARNING, (
+                        f"[W] Plant '{plant_id}': Cannot parse PPM range '{ppm_range}'"
+                    )
+                else:
+                    ppm_min, ppm_max = parsed
                     if ppm_min >= ppm_max:
-                        self.issues.append(
+                        yield ISSUE, (
                             f"[!] Plant '{plant_id}': Invalid PPM range {ppm_range} (min >= max)"
                         )
                     if ppm_min < 0 or ppm_max > 500:
-                        self.warnings.append(
+                        yield WARNING, (
                             f"[W] Plant '{plant_id}': Unusual PPM range {ppm_range}"
                         )
-                except:
-                    self.warnings.append(
-                        f"[W] Plant '{plant_id}': Cannot parse PPM range '{ppm_range}'"
-                    )
 
             # Parse pH range
             if ph_range and '-' in str(ph_range):
-                try:
-                    ph_min, ph_max = map(float, str(ph_range).split('-'))
+                parsed = self._parse_range(ph_range, float)
+                if parsed is None:
+                    yield WARNING, (
+                        f"[W] Plant '{plant_id}': Cannot parse pH range '{ph_range}'"
+                    )
+                else:
+                    ph_min, ph_max = parsed
                     if ph_min >= ph_max:
-                        self.issues.append(
+                        yield ISSUE, (
                             f"[!] Plant '{plant_id}': Invalid pH range {ph_range} (min >= max)"
                         )
                     if ph_min < 4.0 or ph_max > 8.0:
-                        self.warnings.append(
+                        yield WARNING, (
                             f"[W] Plant '{plant_id}': Unusual pH range {ph_range}"
                         )
-                except:
-                    self.warnings.append(
-                        f"[W] Plant '{plant_id}': Cannot parse pH range '{ph_range}'"
-                    )
 
-        print("   [+] PPM and pH ranges checked\n")
+        self._progress("   [+] PPM and pH ranges checked\n")
 
-    def check_duplicates_and_conflicts(self):
-        """Check for duplicate names and potential conflicts"""
-        print("[*] Checking for duplicates and conflicts...")
-
-        plants_data = self.plants.get('plants', {})
-
-        # Check for duplicate plant names
-        plant_names = {}
-        for plant_id, plant_data in plants_data.items():
-            name = plant_data.get('name', '')
-            if name in plant_names:
-                self.warnings.append(
-                    f"[W] Duplicate plant name '{name}': {plant_names[name]} and {plant_id}"
-                )
-            else:
-                plant_names[name] = plant_id
-
-        print("   [+] Duplicates and conflicts checked\n")
+    def _parse_range(self, value, cast):
+        """Parse "min-max" range, returns (min, max) or None if malformed"""
+        m = self._RANGE_RE.match(str(value))
+        if m is None:
+            return None
+        try:
+            return cast(m.group(1)), cast(m.group(2))
+        except (ValueError, TypeError):
+            return None
 
     def print_report(self):
         """Print audit report"""
@@ -278,32 +515,42 @@ class PlantsDatabaseAuditor:
         print("AUDIT REPORT")
         print("="*60 + "\n")
 
-        if not self.issues and not self.warnings:
+        if not self._issue_count and not self._warning_count:
             print("[OK] NO ISSUES FOUND - Database is consistent!\n")
             return
 
-        if self.issues:
-            print(f"[!] CRITICAL ISSUES ({len(self.issues)}):\n")
-            for issue in self.issues:
-                print(f"  {issue}")
+        if self._issue_count:
+            print(f"[!] CRITICAL ISSUES ({self._issue_count}):\n")
+            sys.stdout.write(self._issues_buf.getvalue())
             print()
 
-        if self.warnings:
-            print(f"[W]  WARNINGS ({len(self.warnings)}):\n")
-            for warning in self.warnings:
-                print(f"  {warning}")
+        if self._warning_count and not self.quiet:
+            print(f"[W]  WARNINGS ({self._warning_count}):\n")
+            sys.stdout.write(self._warnings_buf.getvalue())
             print()
 
         # Summary
         print("="*60)
-        print(f"Summary: {len(self.issues)} issues, {len(self.warnings)} warnings")
+        print(f"Summary: {self._issue_count} issues, {self._warning_count} warnings")
         print("="*60 + "\n")
 
-        if self.issues:
+        if self._issue_count:
             sys.exit(1)
         else:
             sys.exit(0)
 
 if __name__ == "__main__":
-    auditor = PlantsDatabaseAuditor()
+    parser = argparse.ArgumentParser(description="Plants database consistency audit")
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        default=os.environ.get('AUDIT_QUIET', '') not in ('', '0'),
+        help="don't list warnings, only critical issues (also AUDIT_QUIET=1)"
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', default=None,
+        help="print progress of each check (default when run in a terminal)"
+    )
+    args = parser.parse_args()
+
+    auditor = PlantsDatabaseAuditor(quiet=args.quiet, verbose=args.verbose)
     auditor.audit_all()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the field-selective YAML loader in audit.py
+Запуск: python -m unittest test_audit
+"""
+
+import io
+import unittest
+from pathlib import Path
+
+import yaml
+
+import audit
+
+BASE_PATH = Path(__file__).resolve().parent
+
+
+def _select(data, fields):
+    """Reduce a fully loaded document to the parts selected by fields"""
+    if fields is True:
+        return data
+    if isinstance(data, list):
+        return [_select(item, fields) for item in data]
+    if not isinstance(data, dict):
+        return data
+    selected = {}
+    for key, value in data.items():
+        sub = fields.get(key, fields.get('*'))
+        if sub is not None:
+            selected[key] = _select(value, sub)
+    return selected
+
+
+def _load_fields(text: str, fields):
+    return audit._load_fields(io.BytesIO(text.encode('utf-8')), fields)
+
+
+class LoadFieldsTest(unittest.TestCase):
+    def assert_matches_full_load(self, filename, fields):
+        with open(BASE_PATH / filename, 'rb') as f:
+            full = yaml.load(f, Loader=audit.YamlLoader)
+        with open(BASE_PATH / filename, 'rb') as f:
+            selected = audit._load_fields(f, fields)
+        self.assertIsNotNone(selected)
+        self.assertEqual(selected, _select(full, fields))
+
+    def test_plants_yaml(self):
+        self.assert_matches_full_load('plants.yaml', audit.PLANTS_FIELDS)
+
+    def test_water_requirements_yaml(self):
+        self.assert_matches_full_load('water-requirements.yaml', audit.WATER_FIELDS)
+
+    def test_scalar_types(self):
+        data = _load_fields("a: 7\nb: false\nc: '7'\nd: 5.8-6.2\ne: ~\n", {'*': True})
+        self.assertEqual(data, {'a': 7, 'b': False, 'c': '7', 'd': '5.8-6.2', 'e': None})
+
+    def test_falls_back_on_merge_key(self):
+        self.assertIsNone(_load_fields("p:\n  <<: {notes: shared}\n  name: x\n", {'*': True}))
+
+    def test_falls_back_on_alias(self):
+        self.assertIsNone(_load_fields("a: &x 1\nb: *x\n", {'*': True}))
+
+    def test_falls_back_on_tagged_collection(self):
+        self.assertIsNone(_load_fields("plants: !!omap\n  - a: 1\n", {'*': True}))
+
+    def test_falls_back_on_multiple_documents(self):
+        self.assertIsNone(_load_fields("a: 1\n---\nb: 2\n", {'*': True}))
+
+    def test_falls_back_on_parse_error(self):
+        self.assertIsNone(_load_fields("a: [1\n", {'*': True}))
+
+
+if __name__ == "__main__":
+    unittest.main()